@@ -19,7 +19,7 @@ setup(
     # https://packaging.python.org/en/latest/single_source_version.html
     version='1.1',
 
-    description='A Python 2/3 API wrapper for World Bank',
+    description='A Python 3 API wrapper for World Bank',
     long_description=long_description,
 
     # The project's main homepage.
@@ -49,18 +49,29 @@ setup(
 
         # Specify the Python versions you support here. In particular, ensure
         # that you indicate whether you support Python 2, Python 3 or both.
-        'Programming Language :: Python :: 2',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
         'Programming Language :: Python :: 3.5',
+        'Programming Language :: Python :: 3 :: Only',
     ],
 
+    python_requires='>=3.5',
+
     # What does your project relate to?
     keywords='api worldbank country economics indicators',
 
     # You can just specify the packages manually here if your project is
     # simple. Or you can use find_packages().
     packages=find_packages(),
+
+    # Run-time dependencies, installed by pip alongside the project.
+    install_requires=['requests'],
+
+    # Optional dependencies, ex. pip install worldbank-python[stream]
+    extras_require={
+        'stream': ['ijson>=3.1'],
+        'speedups': ['orjson', 'brotli'],
+        'numpy': ['numpy'],
+        'pandas': ['pandas'],
+        'async': ['httpx[http2]'],
+    },
 )
@@ -0,0 +1,115 @@
+import json
+import unittest
+from unittest import mock
+from urllib.parse import parse_qsl, urlsplit
+
+from worldbank import api
+
+
+def indicator_data(indicator_id):
+    return {
+        'id': indicator_id,
+        'name': 'Indicator %s' % indicator_id,
+        'unit': '',
+        'source': {'id': '2', 'value': 'World Development Indicators'},
+        'sourceNote': '',
+        'sourceOrganization': 'World Bank',
+        'topics': [{'id': '3', 'value': 'Economy & Growth'}],
+    }
+
+
+class FakeResponse(object):
+    """
+    The parts of a requests response the API helpers use
+    """
+
+    def __init__(self, data):
+        self.text = json.dumps(data)
+        self.content = self.text.encode('utf-8')
+        self.status_code = 200
+        self.headers = {'Content-Length': str(len(self.content))}
+
+    def raise_for_status(self):
+        pass
+
+
+def fake_indicators_api(url, **kwargs):
+    """
+    Answers /indicators/{ids} like the API: counts are ints, except per_page, which is a string
+    """
+    path = url.split('?')[0]
+    indicator_ids = path.rsplit('/', 1)[1].split(';')
+    per_page = dict(parse_qsl(urlsplit(url).query)).get('per_page', len(indicator_ids))
+    summary = {'page': 1, 'pages': 1, 'per_page': str(per_page), 'total': len(indicator_ids), 'lastupdated': '2024-01-01'}
+    return FakeResponse([summary, [indicator_data(indicator_id) for indicator_id in indicator_ids]])
+
+
+class IndicatorGetManyTest(unittest.TestCase):
+
+    def setUp(self):
+        api.Indicator.get.__func__.cache.clear()
+        patches = [
+            mock.patch.object(api._session, 'get', side_effect=fake_indicators_api),
+            mock.patch.object(api, '_cache', None),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_primed_summary_matches_single_request(self):
+        summary, instances = api.Indicator.get_many(['A', 'B', 'C'])
+        self.assertEqual([instance.id for instance in instances], ['A', 'B', 'C'])
+        self.assertEqual(summary['total'], 3)
+
+        api._session.get.reset_mock()
+        primed_summary, primed_instances = api.Indicator.get('C')
+        self.assertFalse(api._session.get.called)
+
+        requested_summary, requested_instances = api.Indicator.get.__wrapped__(api.Indicator, 'C')
+        self.assertEqual(primed_summary, requested_summary)
+        self.assertEqual(primed_instances[0].id, requested_instances[0].id)
+
+
+def observation_data(**fields):
+    data = {
+        'indicator': {'id': 'NY.GDP.MKTP.CD', 'value': 'GDP (current US$)'},
+        'country': {'id': 'US', 'value': 'United States'},
+        'countryiso3code': 'USA',
+        'date': '2020',
+        'value': 20936600000000,
+        'unit': '',
+        'obs_status': '',
+        'decimal': 0,
+    }
+    data.update(fields)
+    return data
+
+
+class CountryIndicatorFromApiTest(unittest.TestCase):
+
+    def test_does_not_modify_data(self):
+        data = observation_data()
+        country = data['country']
+        instance = api.CountryIndicator.from_api(data)
+        self.assertIs(data['country'], country)
+        self.assertEqual(country, {'id': 'US', 'value': 'United States'})
+        self.assertEqual(instance.country, country)
+        self.assertIsNot(instance.country, country)
+
+    def test_null_country(self):
+        instance = api.CountryIndicator.from_api(observation_data(country=None))
+        self.assertIsNone(instance.country)
+
+    def test_null_country_fields(self):
+        instance = api.CountryIndicator.from_api(observation_data(country={'id': None, 'value': None}, countryiso3code=None))
+        self.assertEqual(instance.country, {'id': None, 'value': None})
+        self.assertIsNone(instance.country_iso3code)
+
+    def test_null_indicator_name(self):
+        instance = api.CountryIndicator.from_api(observation_data(indicator={'id': 'X.NULL.NAME', 'value': None}))
+        self.assertEqual(instance.indicator.id, 'X.NULL.NAME')
+        self.assertIsNone(instance.indicator.name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,66 +2,536 @@
 A Python wrapper for the WorldBank API (See: https://datahelpdesk.worldbank.org/knowledgebase/topics/125589-developer-information)
 """
 
-from __future__ import unicode_literals
-from __future__ import print_function
+import asyncio
 import logging
 import json
+import operator
 import functools
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from sys import intern
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 try:
-    # Python 3
-    from urllib.request import Request, urlopen
-    from urllib.parse import urlencode
+    import ijson
 except ImportError:
-    # Python 2
-    from urllib2 import Request, urlopen
-    from urllib import urlencode
+    ijson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2
+except ImportError:
+    h2 = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    # orjson parses bytes directly, several times faster than the json module
+    from orjson import loads as _loads
+except ImportError:
+    def _loads(data):
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+        return json.loads(data)
 
 logger = logging.getLogger(__name__)
 
+# seconds to wait for the World Bank API before giving up on a request
+_DEFAULT_TIMEOUT = 30
+# responses smaller than this many bytes, as sent, are parsed in one go, since ijson only pays off on large bodies
+_STREAM_MIN_SIZE = 1 << 20
+
+# a single session keeps the TCP+TLS connection to the API alive between calls,
+# and asks for compressed responses, which requests decompresses transparently.
+# ACCEPT_ENCODING lists only the encodings urllib3 can decode here, adding br when brotli is installed
+_session = requests.Session()
+_session.headers.update({
+    'Connection': 'keep-alive',
+    'Accept-Encoding': ACCEPT_ENCODING,
+})
+# enough pooled connections for the worker threads of get_all and fetch_many, and
+# retries with backoff for dropped connections and transient server errors
+_session.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=(500, 502, 503, 504)),
+))
+
+
+def memoize(obj=None, maxsize=1024, ttl=None):
+    """
+    Caches the results of a function by its arguments, keeping at most ``maxsize`` of the most recently used results
 
-def memoize(obj):
-    cache = obj.cache = {}
+    Results older than ``ttl`` seconds, when given, are discarded and fetched again.
+    Calls with unhashable arguments are passed through without caching.
+    Results fetched some other way can be stored with the ``prime(value, *args, **kwargs)`` attribute of the decorated function.
+    """
+    if obj is None:
+        return functools.partial(memoize, maxsize=maxsize, ttl=ttl)
+    cache = obj.cache = OrderedDict()
+    lock = threading.Lock()
+    # number of results stored since expired results were last swept from the cache
+    inserts = 0
+
+    def store(key, value):
+        nonlocal inserts
+        now = time.monotonic()
+        with lock:
+            cache[key] = (value, None if ttl is None else now + ttl)
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+            inserts += 1
+            if ttl is not None and inserts >= 100:
+                inserts = 0
+                for expired_key in [cached_key for cached_key, (cached_value, expires) in cache.items() if expires <= now]:
+                    del cache[expired_key]
+
+    def prime(value, *args, **kwargs):
+        store((args, tuple(sorted(kwargs.items()))) if kwargs else (args, ()), value)
 
     @functools.wraps(obj)
     def memoizer(*args, **kwargs):
-        key = str(args) + str(kwargs)
-        if key not in cache:
-            cache[key] = obj(*args, **kwargs)
-        return cache[key]
+        key = (args, tuple(sorted(kwargs.items()))) if kwargs else (args, ())
+        try:
+            with lock:
+                value, expires = cache[key]
+                if expires is None or expires > time.monotonic():
+                    cache.move_to_end(key)
+                    return value
+                del cache[key]
+            hashable = True
+        except KeyError:
+            hashable = True
+        except TypeError:
+            hashable = False
+        value = obj(*args, **kwargs)
+        if hashable:
+            store(key, value)
+        return value
+    memoizer.prime = prime
     return memoizer
 
 
+class _ResponseCache(object):
+    """
+    A SQLite store of API responses, served without a request while younger than ``expire_after`` seconds,
+    and otherwise revalidated with the ETag/Last-Modified headers the API sent with them
+    """
+
+    def __init__(self, path, expire_after=None):
+        self.expire_after = expire_after
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute('CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body TEXT, stored REAL)')
+
+    def get(self, key):
+        """
+        Returns:
+            tuple (str, str, str, float): the etag, last modified date, body and storage time of the cached response, or None
+        """
+        with self._lock:
+            return self._connection.execute('SELECT etag, last_modified, body, stored FROM responses WHERE key = ?', (key, )).fetchone()
+
+    def is_fresh(self, stored):
+        return self.expire_after is not None and time.time() - stored < self.expire_after
+
+    def set(self, key, etag, last_modified, body):
+        with self._lock, self._connection:
+            self._connection.execute('INSERT OR REPLACE INTO responses (key, etag, last_modified, body, stored) VALUES (?, ?, ?, ?, ?)', (key, etag, last_modified, body, time.time()))
+
+    def touch(self, key):
+        """
+        Restarts the expiry of a response the API reported as unchanged
+        """
+        with self._lock, self._connection:
+            self._connection.execute('UPDATE responses SET stored = ? WHERE key = ?', (time.time(), key))
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+_cache = None
+
+
+def enable_cache(path, expire_after=None):
+    """
+    Persists API responses to a SQLite database so later calls, including those in later processes,
+    can skip downloading any response the API reports as unchanged
+
+    Arguments:
+        path (str): The path of the SQLite database, created if it does not exist
+        expire_after (int, optional): The number of seconds a cached response is used without asking the API whether it changed,
+            by default responses are always revalidated
+    """
+    global _cache
+    disable_cache()
+    _cache = _ResponseCache(path, expire_after=expire_after)
+
+
+def disable_cache():
+    """
+    Stops persisting API responses to disk
+    """
+    global _cache
+    if _cache is not None:
+        _cache.close()
+        _cache = None
+
+
+@memoize(maxsize=256)
+def _encode_parameters(items):
+    # doseq encodes list values as one key=value pair per item
+    return urlencode(items, doseq=True)
+
+
+def _query_url(url, parameters):
+    """
+    Returns the URL with its parameters, sorted so equal parameters always produce the same URL
+    """
+    # copy the parameters, rather than add the format to the caller's dictionary
+    parameters = dict(parameters, format=parameters.get('format', 'json'))
+    return '%s?%s' % (url, _encode_parameters(tuple(sorted(parameters.items()))))
+
+
+def _cached_response(cache, url, headers):
+    """
+    Returns:
+        tuple (tuple, dict): the cached etag, last modified date, body and storage time of the URL, or None,
+            and the headers to request it with, which ask the API to only resend a cached response if it changed
+    """
+    cached = cache.get(url) if cache is not None else None
+    if cached:
+        etag, last_modified, body, stored = cached
+        headers = dict(headers)
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    return cached, headers
+
+
+def _store_response(cache, url, response):
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    # without validators a response can only be reused until it expires
+    if etag or last_modified or cache.expire_after is not None:
+        cache.set(url, etag, last_modified, response.text)
+
+
 def _request(url, **kwargs):
     headers = kwargs.get('headers', {})
     parameters = kwargs.get('parameters', {})
-    data = kwargs.get('data', {})
 
-    parameters.setdefault('format', 'json')
+    url = _query_url(url, parameters)
 
-    encoded_parameters = urlencode(parameters)
-    if encoded_parameters:
-        url = '%s?%s' % (url, encoded_parameters)
+    cache = _cache
+    cached, headers = _cached_response(cache, url, headers)
+    if cached and cache.is_fresh(cached[3]):
+        logger.debug('%s served from cache', url)
+        return _loads(cached[2])
 
     logger.debug(url)
-    request = Request(url)
-    for key, value in headers.items():
-        request.add_header(key, value)
+    try:
+        response = _session.get(url, headers=headers, timeout=_DEFAULT_TIMEOUT)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        logger.error('%s failed: %s', url, e)
+        raise
+
+    if cached and response.status_code == 304:
+        logger.debug('%s not modified, using cached response', url)
+        cache.touch(url)
+        return _loads(cached[2])
+
+    if logger.isEnabledFor(logging.DEBUG):
+        # response.text decodes the whole body, so only build it when it will be logged
+        logger.debug(response.text)
+    response_data = _loads(response.content)
+    if cache is not None:
+        _store_response(cache, url, response)
+    return response_data
+
+
+def _iter_response(events):
+    """
+    Builds the summary, then each record, of an API response from a stream of ijson parser events
+
+    The API responds with a two-item array: a summary object, and an array of records.
+    """
+    builder = None
+    for prefix, event, value in events:
+        if builder is None:
+            if event != 'start_map' or prefix not in ('item', 'item.item'):
+                continue
+            builder = ijson.ObjectBuilder()
+            start_prefix = prefix
+        builder.event(event, value)
+        if event == 'end_map' and prefix == start_prefix:
+            yield builder.value
+            builder = None
+
+
+def _request_stream(url, **kwargs):
+    """
+    Like _request, but parses the records of the response as it is downloaded rather than after
+    buffering the whole body.  Falls back to _request when ijson is not installed or responses are cached,
+    and parses the body in one go when the response declares a length under _STREAM_MIN_SIZE.
+
+    Returns:
+        tuple (dict, iterator): dictionary summary, and an iterator over the records
+    """
+    if ijson is None or _cache is not None:
+        summary, data = _request(url, **kwargs)
+        return summary, iter(data or ())
+
+    headers = kwargs.get('headers', {})
+    parameters = kwargs.get('parameters', {})
+
+    url = _query_url(url, parameters)
+
+    logger.debug(url)
+    try:
+        response = _session.get(url, headers=headers, timeout=_DEFAULT_TIMEOUT, stream=True)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        logger.error('%s failed: %s', url, e)
+        raise
+    length = response.headers.get('Content-Length')
+    if length is not None and int(length) < _STREAM_MIN_SIZE:
+        summary, data = _loads(response.content)
+        return summary, iter(data or ())
+    # let urllib3 undo the gzip encoding of the body before ijson reads it
+    response.raw.decode_content = True
+
+    def records(items):
+        try:
+            for item in items:
+                yield item
+        finally:
+            response.close()
+
+    items = _iter_response(ijson.parse(response.raw, use_float=True))
+    summary = next(items, None)
+    return summary, records(items)
+
+
+# one client, and the task that closes it, per event loop, since connections cannot be shared between loops.
+# Entries are removed when their client is closed, which releases the loop the client refers to.
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def _async_client():
+    """
+    Returns the httpx client of the running event loop, which multiplexes concurrent requests over one HTTP/2 connection when h2 is installed
+    """
+    if httpx is None:
+        raise ImportError('httpx is required for asynchronous requests')
+    loop = asyncio.get_event_loop()
+    entry = _async_clients.get(loop)
+    if entry is None:
+        limits = httpx.Limits(max_connections=32, max_keepalive_connections=8)
+        client = httpx.AsyncClient(http2=h2 is not None, limits=limits, timeout=_DEFAULT_TIMEOUT)
+        entry = _async_clients[loop] = (client, loop.create_task(_close_async_client(loop, client)))
+    return entry[0]
+
+
+async def _close_async_client(loop, client):
+    """
+    Waits until cancelled, as asyncio.run does to the tasks still pending when its coroutine returns, then closes the client
+    """
+    try:
+        await loop.create_future()
+    finally:
+        if _async_clients.get(loop, (None, ))[0] is client:
+            del _async_clients[loop]
+        await client.aclose()
+
+
+async def aclose():
+    """
+    Closes the HTTP client of the running event loop, and its connections.
+
+    The client is closed when asyncio.run returns, so this is only needed with event loops that are
+    closed without first cancelling their pending tasks.  Later asynchronous requests open a new client.
+    """
+    entry = _async_clients.pop(asyncio.get_event_loop(), None)
+    if entry is not None:
+        client, closer = entry
+        closer.cancel()
+        await client.aclose()
+
+
+async def _request_async(url, **kwargs):
+    """
+    Like _request, but awaits the response so many requests can be in flight at once
+    """
+    headers = kwargs.get('headers', {})
+    parameters = kwargs.get('parameters', {})
+
+    url = _query_url(url, parameters)
 
-    for key, value in data.items():
-        request.add_data(key, value)
+    # SQLite lookups are local and short, so the cache is used from the event loop directly
+    cache = _cache
+    cached, headers = _cached_response(cache, url, headers)
+    if cached and cache.is_fresh(cached[3]):
+        logger.debug('%s served from cache', url)
+        return _loads(cached[2])
 
+    logger.debug(url)
     try:
-        response = urlopen(request)
-    except Exception as e:
-        logger.error(e)
+        response = await _async_client().get(url, headers=headers)
+        # unlike requests, httpx also raises for the 304 Not Modified answer to a revalidation
+        if not (cached and response.status_code == 304):
+            response.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.error('%s failed: %s', url, e)
         raise
-    raw_response_data = response.read().decode("utf-8")
-    logger.debug(raw_response_data)
-    response_data = json.loads(raw_response_data)
+
+    if cached and response.status_code == 304:
+        logger.debug('%s not modified, using cached response', url)
+        cache.touch(url)
+        return _loads(cached[2])
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(response.text)
+    response_data = _loads(response.content)
+    if cache is not None:
+        _store_response(cache, url, response)
     return response_data
 
 
+def fetch_many(calls, max_workers=8):
+    """
+    Runs independent API calls concurrently over the shared keep-alive session
+
+    Arguments:
+        calls (list): callables taking no arguments, ex. ``Country.get`` or ``functools.partial(Country.get, per_page=100)``
+        max_workers (int, optional): The maximum number of requests in flight at once, defaults to 8.
+
+    Returns:
+        list: the result of each call, in the same order as ``calls``
+    """
+    calls = list(calls)
+    if len(calls) < 2:
+        return [call() for call in calls]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+        futures = [executor.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
+
+def iter_pages(method, *args, **kwargs):
+    """
+    Iterates over every page of a paginated API call, fetching the next page in the background while the current page is processed
+
+    Arguments:
+        method (function): The API call to page through, ex. ``Indicator.get`` or ``Country.by_income_level``
+        *args: Positional arguments of ``method``
+
+    Keyword Arguments:
+        page (int, optional):  The first page to get, defaults to 1.
+        per_page (int, optional):  The number of items to fetch in each page, defaults to 1000.
+        **kwargs: Other keyword arguments of ``method``
+
+    Yields:
+        tuple (dict, list): dictionary summary, and a list of instances, for each page
+    """
+    page = kwargs.pop('page', 1)
+    kwargs.setdefault('per_page', 1000)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(method, *args, page=page, **kwargs)
+        while future is not None:
+            summary, instances = future.result()
+            # some endpoints report page counts as strings
+            pages = int(summary.get('pages') or 0)
+            future = executor.submit(method, *args, page=page + 1, **kwargs) if page < pages else None
+            yield summary, instances
+            page += 1
+
+
+def get_all(method, *args, max_workers=16, **kwargs):
+    """
+    Fetches every page of a paginated API call, requesting all of the pages after the first in a thread pool
+
+    Arguments:
+        method (function): The API call, ex. ``Indicator.get``
+        *args: Positional arguments of ``method``
+        max_workers (int, optional): The maximum number of pages requested at once, defaults to 16.
+
+    Keyword Arguments:
+        per_page (int, optional):  The number of items to fetch in each page, defaults to 50.
+        **kwargs: Other keyword arguments of ``method``
+
+    Returns:
+        tuple (dict, list): dictionary summary of the first page, and a list of the instances of every page
+    """
+    kwargs.pop('page', None)
+    summary, first_instances = method(*args, page=1, **kwargs)
+    # copy, since memoized calls return shared lists
+    instances = list(first_instances)
+    pages = int(summary.get('pages') or 0)
+    if pages > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, pages - 1)) as executor:
+            futures = [executor.submit(method, *args, page=page, **kwargs) for page in range(2, pages + 1)]
+            for future in futures:
+                page_summary, page_instances = future.result()
+                instances.extend(page_instances)
+    return summary, instances
+
+
+async def aget_all(method, *args, max_concurrency=64, **kwargs):
+    """
+    Fetches every page of an asynchronous API call, requesting all of the pages after the first concurrently
+
+    Arguments:
+        method (function): The asynchronous API call, ex. ``Indicator.aget``
+        *args: Positional arguments of ``method``
+        max_concurrency (int, optional): The maximum number of pages requested at once, defaults to 64.
+
+    Keyword Arguments:
+        per_page (int, optional):  The number of items to fetch in each page, defaults to 50.
+        **kwargs: Other keyword arguments of ``method``
+
+    Returns:
+        tuple (dict, list): dictionary summary of the first page, and a list of the instances of every page
+    """
+    kwargs.pop('page', None)
+    summary, instances = await method(*args, page=1, **kwargs)
+    pages = int(summary.get('pages') or 0)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def get_page(page):
+        async with semaphore:
+            page_summary, page_instances = await method(*args, page=page, **kwargs)
+            return page_instances
+
+    for page_instances in await asyncio.gather(*[get_page(page) for page in range(2, pages + 1)]):
+        instances.extend(page_instances)
+    return summary, instances
+
+
 domain = "https://api.worldbank.org/v2"
 
 
@@ -81,7 +551,12 @@ class Source(object):
 
     See https://datahelpdesk.worldbank.org/knowledgebase/articles/898587-api-catalog-source-queries
     """
-    __slots__ = ('id', 'code', 'name', 'description', 'url', 'concepts', 'data_availability', 'metadata_availability')
+    __slots__ = ('id', 'code', 'name', 'description', 'url', 'concepts', 'data_availability', 'metadata_availability', '__weakref__')
+
+    _URL = domain + '/sources'
+
+    # instances shared between the records that reference them, see _from_api_pooled
+    _pool = weakref.WeakValueDictionary()
 
     def __init__(self, id, code, name, description, url, concepts, data_availability, metadata_availability):
         self.id = id
@@ -104,18 +579,30 @@ class Source(object):
         """
         Returns a class instance from API data
         """
+        get = data.get
         source_id = data['id']
-        code = data.get('code')
-        name = data.get('value', data.get('name', None))
-        name = name.encode('ascii', 'ignore')
-        description = data.get('description', None)
-        url = data.get('url', None)
-        concepts = data.get('concepts')
-        data_availability = data.get('dataavailability')
-        metadata_availability = data.get('metadataavailability')
+        code = get('code')
+        name = get('value') or get('name')
+        description = get('description')
+        url = get('url')
+        concepts = get('concepts')
+        data_availability = get('dataavailability')
+        metadata_availability = get('metadataavailability')
         return cls(source_id, code, name, description, url, concepts, data_availability, metadata_availability)
 
     @classmethod
+    def _from_api_pooled(cls, data):
+        """
+        Returns a class instance from API data, shared with any other record that references the same data
+        """
+        key = (data['id'], data.get('value'))
+        instance = cls._pool.get(key)
+        if instance is None:
+            instance = cls._pool[key] = cls.from_api(data)
+        return instance
+
+    @classmethod
+    @memoize(ttl=3600)
     def get(cls, **kwargs):
         """
         Keyword Arguments:
@@ -125,11 +612,28 @@ class Source(object):
         Returns:
             tuple (dict, list): dictionary summary, and a list of instances
         """
-        url = '%s/sources' % domain
+        url = cls._URL
         summary, data = _request(url, parameters=kwargs)
         instances = [cls.from_api(item) for item in data]
         return summary, instances
 
+    @classmethod
+    async def aget(cls, **kwargs):
+        """
+        Like get, but awaits the API so it can run concurrently with other requests, ex. with asyncio.gather
+
+        Keyword Arguments:
+            page (int, optional):  The page number to get, defaults to 1.
+            per_page (int, optional):  The number of items to fetch in each page, defaults to 50.
+
+        Returns:
+            tuple (dict, list): dictionary summary, and a list of instances
+        """
+        url = cls._URL
+        summary, data = await _request_async(url, parameters=kwargs)
+        instances = [cls.from_api(item) for item in data]
+        return summary, instances
+
 
 class IncomeLevel(object):
     """
@@ -142,6 +646,11 @@ class IncomeLevel(object):
     """
     __slots__ = ('id', 'name', 'iso2code')
 
+    # the API fields of the constructor arguments, in order, read from the data in one call
+    _api_fields = operator.itemgetter('id', 'value', 'iso2code')
+
+    _URL = domain + '/incomeLevels'
+
     def __init__(self, id, name, iso2code):
         self.id = id
         self.name = name
@@ -151,19 +660,17 @@ class IncomeLevel(object):
         return self.id
 
     def __repr__(self):
-        return '<%s %s id=%s, code=%s, name=%s>' % (self.__class__.__name__, id(self), self.id, self.code, self.name)
+        return '<%s %s id=%s, iso2code=%s, name=%s>' % (self.__class__.__name__, id(self), self.id, self.iso2code, self.name)
 
     @classmethod
     def from_api(cls, data):
         """
         Returns a class instance from API data
         """
-        income_level_id = data['id']
-        name = data['value']
-        iso2code = data['iso2code']
-        return cls(income_level_id, name, iso2code)
+        return cls(*cls._api_fields(data))
 
     @classmethod
+    @memoize(ttl=3600)
     def get(cls, **kwargs):
         """
         Keyword Arguments:
@@ -173,11 +680,28 @@ class IncomeLevel(object):
         Returns:
             tuple (dict, list): dictionary summary, and a list of instances
         """
-        url = '%s/incomeLevels' % domain
+        url = cls._URL
         summary, data = _request(url, parameters=kwargs)
         instances = [cls.from_api(item) for item in data]
         return summary, instances
 
+    @classmethod
+    async def aget(cls, **kwargs):
+        """
+        Like get, but awaits the API so it can run concurrently with other requests, ex. with asyncio.gather
+
+        Keyword Arguments:
+            page (int, optional):  The page number to get, defaults to 1.
+            per_page (int, optional):  The number of items to fetch in each page, defaults to 50.
+
+        Returns:
+            tuple (dict, list): dictionary summary, and a list of instances
+        """
+        url = cls._URL
+        summary, data = await _request_async(url, parameters=kwargs)
+        instances = [cls.from_api(item) for item in data]
+        return summary, instances
+
 
 class LendingType(object):
     """
@@ -191,6 +715,10 @@ class LendingType(object):
     """
     __slots__ = ('id', 'name', 'iso2code')
 
+    _api_fields = operator.itemgetter('id', 'value', 'iso2code')
+
+    _URL = domain + '/lendingTypes'
+
     def __init__(self, id, name, iso2code):
         self.id = id
         self.name = name
@@ -207,12 +735,10 @@ class LendingType(object):
         """
         Returns a class instance from API data
         """
-        lending_type_id = data['id']
-        name = data['value']
-        iso2code = data['iso2code']
-        return cls(lending_type_id, name, iso2code)
+        return cls(*cls._api_fields(data))
 
     @classmethod
+    @memoize(ttl=3600)
     def get(cls, **kwargs):
         """
         Keyword Arguments:
@@ -222,11 +748,28 @@ class LendingType(object):
         Returns:
             tuple (dict, list): dictionary summary, and a list of class instances
         """
-        url = '%s/lendingTypes' % domain
+        url = cls._URL
         summary, data = _request(url, parameters=kwargs)
         instances = [cls.from_api(item) for item in data]
         return summary, instances
 
+    @classmethod
+    async def aget(cls, **kwargs):
+        """
+        Like get, but awaits the API so it can run concurrently with other requests, ex. with asyncio.gather
+
+        Keyword Arguments:
+            page (int, optional):  The page number to get, defaults to 1.
+            per_page (int, optional):  The number of items to fetch in each page, defaults to 50.
+
+        Returns:
+            tuple (dict, list): dictionary summary, and a list of instances
+        """
+        url = cls._URL
+        summary, data = await _request_async(url, parameters=kwargs)
+        instances = [cls.from_api(item) for item in data]
+        return summary, instances
+
 
 class Indicator(object):
     """
@@ -243,7 +786,15 @@ class Indicator(object):
 
     See https://datahelpdesk.worldbank.org/knowledgebase/articles/898599-api-indicator-queries
     """
-    __slots__ = ('id', 'name', 'source', 'topics', 'source_note', 'source_organization', 'unit')
+    __slots__ = ('id', 'name', 'source', 'topics', 'source_note', 'source_organization', 'unit', '__weakref__')
+
+    _URL = domain + '/indicators'
+    _URL_TEMPLATE = domain + '/indicators/{}'
+    _SOURCE_URL_TEMPLATE = domain + '/source/{}/indicator'
+    _TOPIC_URL_TEMPLATE = domain + '/topic/{}/indicator'
+
+    # references shared between the observations that embed them, see _from_api_reference
+    _pool = weakref.WeakValueDictionary()
 
     def __init__(self, id, name, source, topics, source_note, source_organization, unit):
         self.id = id
@@ -265,24 +816,33 @@ class Indicator(object):
         """
         Returns a class instance from API data
         """
+        get = data.get
         indicator_id = data['id']
-        name = data['name'].encode('ascii', 'ignore')
-        source_data = data.get('source', None)
-        topic_data = data.get('topics', [])
-        source_note = data.get('sourceNote', None)
-        source_organization = data.get('sourceOrganization', None).encode('ascii', 'ignore')
-        unit = data['unit']
-        source = Source.from_api(source_data)
-        topics = []
-        for item in topic_data:
-            if 'id' not in item:
-                continue
-            topic = Topic.from_api(item)
-            topics.append(topic)
+        name = data['name']
+        source_data = get('source')
+        topic_data = get('topics') or []
+        source_note = get('sourceNote')
+        source_organization = get('sourceOrganization')
+        unit = get('unit')
+        # the few distinct sources and topics are shared across all indicators
+        source = Source._from_api_pooled(source_data) if source_data else None
+        topic_from_api = Topic._from_api_pooled
+        topics = [topic_from_api(item) for item in topic_data if 'id' in item]
         return cls(indicator_id, name, source, topics, source_note, source_organization, unit)
 
     @classmethod
-    @memoize
+    def _from_api_reference(cls, data):
+        """
+        Returns a class instance holding only the id and name of an indicator embedded in other API data, shared with any other record that references it
+        """
+        key = (data['id'], data.get('value'))
+        instance = cls._pool.get(key)
+        if instance is None:
+            instance = cls._pool[key] = cls(_intern(data['id']), data.get('value'), None, [], None, None, None)
+        return instance
+
+    @classmethod
+    @memoize(maxsize=4096, ttl=3600)
     def get(cls, indicator=None, **kwargs):
         """
         Arguments:
@@ -295,14 +855,94 @@ class Indicator(object):
         Returns:
             tuple (dict, list): dictionary summary, and a list of class instances
         """
-        if indicator:
-            url = '%s/indicators/%s' % (domain, indicator)
-        else:
-            url = '%s/indicators' % domain
-        summary, data = _request(url, parameters=kwargs)
+        url = cls._URL_TEMPLATE.format(indicator) if indicator else cls._URL
+        summary, records = _request_stream(url, parameters=kwargs)
+        instances = [cls.from_api(item) for item in records]
+        return summary, instances
+
+    @classmethod
+    def get_many(cls, indicators, batch_size=100):
+        """
+        Fetches several indicators with one request per ``batch_size`` of them, and stores each in the cache of get,
+        so that get, or CountryIndicator.full_indicator, is then answered without a request
+
+        A cached ``get(id)`` returns the summary of the batch response its indicator came from, with the
+        paging fields a response for that id alone reports: page 1 of 1, with 1 item per page and in total.
+
+        Arguments:
+            indicators (list<Indicator|str>): The desired indicators
+            batch_size (int, optional): The number of indicators to fetch in each request, defaults to 100
+
+        Returns:
+            tuple (dict, list): dictionary summary of the first batch response, with its counts covering every batch,
+                and a list of class instances
+        """
+        indicator_ids = list(OrderedDict.fromkeys(str(indicator) for indicator in indicators))
+        batches = [indicator_ids[index:index + batch_size] for index in range(0, len(indicator_ids), batch_size)]
+        results = fetch_many([functools.partial(cls._get_batch, batch) for batch in batches])
+        get = cls.get.__func__
+        instances = []
+        for batch_summary, batch_instances in results:
+            indicator_summary = dict(batch_summary)
+            for field in ('page', 'pages', 'per_page', 'total'):
+                # the API reports some counts, such as per_page, as strings, so keep the type of each
+                indicator_summary[field] = '1' if isinstance(batch_summary.get(field), str) else 1
+            for instance in batch_instances:
+                get.prime((indicator_summary, [instance]), cls, instance.id)
+            instances.extend(batch_instances)
+        summary = dict(results[0][0]) if results else {}
+        summary.update(page=1, pages=1, per_page=len(instances), total=len(instances))
+        return summary, instances
+
+    @classmethod
+    def _get_batch(cls, indicator_ids):
+        """
+        Fetches the indicators of the given ids in a single request
+        """
+        url = cls._URL_TEMPLATE.format(';'.join(indicator_ids))
+        summary, records = _request_stream(url, parameters={'per_page': len(indicator_ids)})
+        return summary, [cls.from_api(item) for item in records]
+
+    @classmethod
+    async def aget(cls, indicator=None, **kwargs):
+        """
+        Like get, but awaits the API so it can run concurrently with other requests, ex. with asyncio.gather
+
+        Arguments:
+            indicator (Indicator|str): The desired indicator
+
+        Keyword Arguments:
+            page (int, optional):  The page number to get, defaults to 1.
+            per_page (int, optional):  The number of items to fetch in each page, defaults to 50.
+
+        Returns:
+            tuple (dict, list): dictionary summary, and a list of class instances
+        """
+        url = cls._URL_TEMPLATE.format(indicator) if indicator else cls._URL
+        summary, data = await _request_async(url, parameters=kwargs)
         instances = [cls.from_api(item) for item in data]
         return summary, instances
 
+    @classmethod
+    def iter(cls, indicator=None, **kwargs):
+        """
+        Like get, but yields each instance as its record is parsed from the response, without building a list
+
+        Arguments:
+            indicator (Indicator|str): The desired indicator
+
+        Keyword Arguments:
+            page (int, optional):  The page number to get, defaults to 1.
+            per_page (int, optional):  The number of items to fetch in each page, defaults to 50.
+
+        Yields:
+            Indicator: each instance of the page
+        """
+        url = cls._URL_TEMPLATE.format(indicator) if indicator else cls._URL
+        summary, records = _request_stream(url, parameters=kwargs)
+        for item in records:
+            yield cls.from_api(item)
+
     @classmethod
     def by_source(cls, source, **kwargs):
         """
@@ -316,7 +956,7 @@ class Indicator(object):
         Returns:
             tuple (dict, list): dictionary summary, and a list of class instances with a given source
         """
-        url = '%s/source/%s/indicator' % (domain, source.id)
+        url = cls._SOURCE_URL_TEMPLATE.format(source)
         summary, data = _request(url, parameters=kwargs)
         instances = [cls.from_api(item) for item in data]
         return summary, instances
@@ -334,7 +974,7 @@ class Indicator(object):
         Returns:
             tuple (dict, list): dictionary summary, and a list of class instances with a given topic
         """
-        url = '%s/topic/%s/indicator' % (domain, topic.id)
+        url = cls._TOPIC_URL_TEMPLATE.format(topic)
         summary, data = _request(url, parameters=kwargs)
         instances = [cls.from_api(item) for item in data]
         return summary, instances
@@ -353,6 +993,8 @@ class Region(object):
     """
     __slots__ = ('id', 'code', 'name')
 
+    _api_fields = operator.itemgetter('id', 'iso2code', 'value')
+
     def __init__(self, id, code, name):
         self.id = id
         self.code = code
@@ -369,10 +1011,7 @@ class Region(object):
         """
         Returns a class instance from API data
         """
-        id = data['id']
-        code = data['iso2code']
-        name = data['value']
-        return cls(id, code, name)
+        return cls(*cls._api_fields(data))
 
 
 class AdminRegion(Region):
@@ -386,7 +1025,7 @@ class AdminRegion(Region):
 
     See https://datahelpdesk.worldbank.org/knowledgebase/articles/898590-api-country-queries
     """
-    __slots__ = ('id', 'code', 'name')
+    __slots__ = ()
 
 
 class City(object):
@@ -403,6 +1042,8 @@ class City(object):
     """
     __slots__ = ('name', 'latitude', 'longitude')
 
+    _api_fields = operator.itemgetter('name', 'latitude', 'longitude')
+
     def __init__(self, name, latitude, longitude):
         self.name = name
         self.latitude = latitude
@@ -419,10 +1060,31 @@ class City(object):
         """
         Returns a class instance from API data
         """
-        name = data['name']
-        latitude = data['latitude']
-        longitude = data['longitude']
-        return cls(name, latitude, longitude)
+        return cls(*cls._api_fields(data))
+
+
+def _intern(value):
+    """
+    Returns the interned copy of a string, so equal strings share one object, or any other value, such as None, unchanged
+    """
+    return intern(value) if isinstance(value, str) else value
+
+
+def _lazy_from_api(slot, cls):
+    """
+    Returns a property that builds a class instance from the API data stored in ``slot`` the first time it is read
+    """
+    def getter(self):
+        value = getattr(self, slot)
+        if isinstance(value, dict):
+            # the API may send an empty object when a country has no such property
+            value = cls.from_api(value) if value else None
+            setattr(self, slot, value)
+        return value
+
+    def setter(self, value):
+        setattr(self, slot, value)
+    return property(getter, setter)
 
 
 class Country(object):
@@ -435,13 +1097,24 @@ class Country(object):
         iso_code (str):
         region (Region):
         admin_region (AdminRegion):
-        income (IncomeLevel):
+        income_level (IncomeLevel):
         lending_type (LendingType):
         capital (City):
 
+    region, admin_region, income_level and lending_type may also be given as API data, which is converted on first access.
+
     See https://datahelpdesk.worldbank.org/knowledgebase/articles/898590-api-country-queries
     """
-    __slots__ = ('id', 'name', 'iso_code', 'region', 'admin_region', 'income_level', 'lending_type', 'capital')
+    __slots__ = ('id', 'name', 'iso_code', '_region', '_admin_region', '_income_level', '_lending_type', 'capital')
+
+    _URL = domain + '/countries'
+    _URL_TEMPLATE = domain + '/countries/{}'
+
+    # built from their API data only when first read, since most callers never use them
+    region = _lazy_from_api('_region', Region)
+    admin_region = _lazy_from_api('_admin_region', AdminRegion)
+    income_level = _lazy_from_api('_income_level', IncomeLevel)
+    lending_type = _lazy_from_api('_lending_type', LendingType)
 
     def __init__(self, id, name, iso_code, region, admin_region, income_level, lending_type, capital):
         self.id = id
@@ -464,22 +1137,19 @@ class Country(object):
         """
         Returns a class instance from API data
         """
+        get = data.get
         country_id = data['id']
         name = data['name']
-        iso_code = data.get('iso2Code', None)
-        region_data = data.get('region', None)
-        admin_region_data = data.get('adminregion', None)
-        income_level_data = data.get('incomeLevel', None)
-        lending_type_data = data.get('lendingType', None)
-        capital_city = data.get('capitalCity', None)
-        latitude = data.get('latitude', None)
-        longitude = data.get('longitude', None)
-        region = Region.from_api(region_data)
-        admin_region = AdminRegion.from_api(admin_region_data)
-        income_level = IncomeLevel.from_api(income_level_data)
-        lending_type = LendingType.from_api(lending_type_data)
-        capital = City(capital_city, latitude, longitude)
-        return cls(country_id, name, iso_code, region, admin_region, income_level, lending_type, capital)
+        iso_code = get('iso2Code')
+        region_data = get('region')
+        admin_region_data = get('adminregion')
+        income_level_data = get('incomeLevel')
+        lending_type_data = get('lendingType')
+        capital_city = get('capitalCity')
+        latitude = get('latitude')
+        longitude = get('longitude')
+        capital = City(capital_city, latitude, longitude) if capital_city else None
+        return cls(country_id, name, iso_code, region_data, admin_region_data, income_level_data, lending_type_data, capital)
 
     @classmethod
     def get(cls, iso_code=None, **kwargs):
@@ -494,13 +1164,31 @@ class Country(object):
         Returns
             tuple (dict, list): dictionary summary, and a list of instances
         """
-        url = '%s/countries' % domain
-        if iso_code:
-            url = '%s/%s' % (url, iso_code)
+        url = cls._URL_TEMPLATE.format(iso_code) if iso_code else cls._URL
         summary, data = _request(url, parameters=kwargs)
         instances = [cls.from_api(item) for item in data]
         return summary, instances
 
+    @classmethod
+    async def aget(cls, iso_code=None, **kwargs):
+        """
+        Like get, but awaits the API so it can run concurrently with other requests, ex. with asyncio.gather
+
+        Arguments:
+            iso_code (str, optional):  The iso code of the country to fetch
+
+        Keyword Arguments:
+            page (int, optional):  The page number to get, defaults to 1.
+            per_page (int, optional):  The number of items to fetch in each page, defaults to 50.
+
+        Returns
+            tuple (dict, list): dictionary summary, and a list of instances
+        """
+        url = cls._URL_TEMPLATE.format(iso_code) if iso_code else cls._URL
+        summary, data = await _request_async(url, parameters=kwargs)
+        instances = [cls.from_api(item) for item in data]
+        return summary, instances
+
     @classmethod
     def by_income_level(cls, income_level, **kwargs):
         """
@@ -514,7 +1202,7 @@ class Country(object):
         Returns
             tuple (dict, list): dictionary summary, and a list of instances with a given income_level
         """
-        url = '%s/countries' % domain
+        url = cls._URL
         kwargs.setdefault('incomeLevel', str(income_level))
         summary, data = _request(url, parameters=kwargs)
         instances = [cls.from_api(item) for item in data]
@@ -533,7 +1221,7 @@ class Country(object):
         Returns:
             tuple (dict, list): dictionary summary, and a list of instances with a given lending type
         """
-        url = '%s/countries' % domain
+        url = cls._URL
         kwargs.setdefault('lendingType', lending_type.id)
         summary, data = _request(url, parameters=kwargs)
         instances = [cls.from_api(item) for item in data]
@@ -558,6 +1246,8 @@ class CountryIndicator(object):
     """
     __slots__ = ('indicator', 'country_iso3code', 'country', 'year', 'value', 'decimal', 'unit', 'obs_status')
 
+    _URL_TEMPLATE = domain + '/countries/{}/indicators/{}'
+
     def __init__(self, indicator, country_iso3code, country, year, value, decimal, unit, obs_status):
         self.indicator = indicator
         self.country_iso3code = country_iso3code
@@ -565,6 +1255,8 @@ class CountryIndicator(object):
         self.year = year
         self.value = value
         self.decimal = decimal
+        self.unit = unit
+        self.obs_status = obs_status
 
     def __str__(self):
         return str(self.value)
@@ -572,24 +1264,64 @@ class CountryIndicator(object):
     def __repr__(self):
         return '<%s %s country=%s, indicator=%s, year=%s, value=%s>' % (self.__class__.__name__, id(self), self.country, self.indicator, self.year, self.value)
 
+    @property
+    def full_indicator(self):
+        """
+        Indicator: the indicator with its source, topics and notes, fetched with the memoized Indicator.get the first time when only its id and name are known
+
+        The indicators of many observations can be fetched beforehand in a few requests with Indicator.get_many.
+        """
+        indicator = self.indicator
+        if Indicator._pool.get((indicator.id, indicator.name)) is indicator:
+            indicator_summary, indicators = Indicator.get(indicator.id)
+            indicator = self.indicator = indicators[0]
+        return indicator
+
     @classmethod
-    def from_api(cls, data):
+    def from_api(cls, data, indicator=None):
         """
         Returns a class instance from API data
+
+        Arguments:
+            data (dict): API data
+            indicator (Indicator, optional): The indicator the data measures, built from the id and name embedded in the data when not given
         """
-        country = data['country']
-        indicator_data = data['indicator']
-        indicator_summary, indicators = Indicator.get(indicator_data['id'])
-        indicator = indicators[0]
-        year = data['date']
+        # the codes, names and years repeated across observations share one string each
+        country = data.get('country')
+        if country is not None:
+            # a copy, so the caller's data is left as it was
+            country = {'id': _intern(country.get('id')), 'value': _intern(country.get('value'))}
+        if indicator is None:
+            indicator = Indicator._from_api_reference(data['indicator'])
         value = data['value']
         if value:
             value = float(value)
-        decimal = data['decimal']
-        unit = data['unit']
-        obs_status = data['obs_status']
-        country_iso3code = data['countryiso3code']
-        return cls(indicator, country_iso3code, country, year, value, decimal, unit, obs_status)
+        # observations are built in bulk, so write the slots directly rather than through __init__
+        instance = object.__new__(cls)
+        instance.indicator = indicator
+        instance.country_iso3code = _intern(data['countryiso3code'])
+        instance.country = country
+        instance.year = _intern(data['date'])
+        instance.value = value
+        instance.decimal = data['decimal']
+        instance.unit = data['unit']
+        instance.obs_status = data['obs_status']
+        return instance
+
+    @classmethod
+    def _url(cls, indicator, countries, kwargs):
+        """
+        Returns the URL of the observations of an indicator, moving any start/end keyword arguments into a date range
+        """
+        start = kwargs.pop('start', None)
+        end = kwargs.pop('end', None)
+        date = kwargs.get('date', None)
+        if start and end and not date:
+            kwargs['date'] = '%s:%s' % (start, end)
+
+        # the API accepts several countries separated by semicolons
+        iso_code = ';'.join(country.iso_code for country in countries) or 'all'
+        return cls._URL_TEMPLATE.format(iso_code, indicator)
 
     @classmethod
     def get(cls, indicator, country=None, **kwargs):
@@ -601,29 +1333,224 @@ class CountryIndicator(object):
         Keyword Arguments:
             page (int, optional):  The page number to get, defaults to 1.
             per_page (int, optional):  The number of items to fetch in each page, defaults to 50.
+            start (int, optional):  The first year to fetch, used with end
+            end (int, optional):  The last year to fetch, used with start
 
         Returns
             tuple (dict, list): dictionary summary, and a list of instances of the specified CountryIndicator
         """
-        start = kwargs.pop('start', None)
-        end = kwargs.pop('end', None)
-        date = kwargs.get('date', None)
-        if start and end and not date:
-            kwargs.setdefault('%s:%s' % (start, end), None)
+        countries = [country] if country else []
+        return cls.get_many(indicator, countries, **kwargs)
 
-        if country:
-            iso_code = country.iso_code
-        else:
-            iso_code = 'all'
-        url = '%s/countries/%s/indicators/%s' % (domain, iso_code, indicator.id)
-        summary, data = _request(url, parameters=kwargs)
-        instances = [cls.from_api(item) for item in data]
+    @classmethod
+    def get_many(cls, indicator, countries, **kwargs):
+        """
+        Fetches the observations of an indicator for several countries in a single request
+
+        Arguments:
+            indicator (Indicator|str): indicator
+            countries (list<Country>):  The countries for which to fetch CountryIndicators, all countries when empty
+
+        Keyword Arguments:
+            page (int, optional):  The page number to get, defaults to 1.
+            per_page (int, optional):  The number of items to fetch in each page, defaults to 50.
+            start (int, optional):  The first year to fetch, used with end
+            end (int, optional):  The last year to fetch, used with start
+
+        Returns
+            tuple (dict, list): dictionary summary, and a list of instances of the specified CountryIndicator
+        """
+        countries = list(countries)
+        url = cls._url(indicator, countries, kwargs)
+        summary, records = _request_stream(url, parameters=kwargs)
+        if not isinstance(indicator, Indicator):
+            # from_api builds the indicator from each record, see full_indicator
+            indicator = None
+        instances = [cls.from_api(item, indicator=indicator) for item in records]
+
+        if countries:
+            countries_by_code = {country.iso_code: country for country in countries}
+            for instance in instances:
+                if instance.country is not None:
+                    instance.country = countries_by_code.get(instance.country['id'], instance.country)
+        return summary, instances
+
+    @classmethod
+    async def aget(cls, indicator, country=None, **kwargs):
+        """
+        Like get, but awaits the API so it can run concurrently with other requests, ex. with asyncio.gather
+
+        Arguments:
+            indicator (Indicator|str): indicator
+            country (Country|str,optional):  The country for which to fetch CountryIndicators
+
+        Keyword Arguments:
+            page (int, optional):  The page number to get, defaults to 1.
+            per_page (int, optional):  The number of items to fetch in each page, defaults to 50.
+            start (int, optional):  The first year to fetch, used with end
+            end (int, optional):  The last year to fetch, used with start
+
+        Returns
+            tuple (dict, list): dictionary summary, and a list of instances of the specified CountryIndicator
+        """
+        countries = [country] if country else []
+        url = cls._url(indicator, countries, kwargs)
+        summary, data = await _request_async(url, parameters=kwargs)
+        if not isinstance(indicator, Indicator):
+            # from_api builds the indicator from each record, see full_indicator
+            indicator = None
+        instances = [cls.from_api(item, indicator=indicator) for item in data]
 
         if country:
             for instance in instances:
                 instance.country = country
         return summary, instances
 
+    @classmethod
+    def iter(cls, indicator, country=None, **kwargs):
+        """
+        Like get, but yields each instance as its record is parsed from the response, without building a list
+
+        Arguments:
+            indicator (Indicator|str): indicator
+            country (Country|str,optional):  The country for which to fetch CountryIndicators
+
+        Keyword Arguments:
+            page (int, optional):  The page number to get, defaults to 1.
+            per_page (int, optional):  The number of items to fetch in each page, defaults to 50.
+            start (int, optional):  The first year to fetch, used with end
+            end (int, optional):  The last year to fetch, used with start
+
+        Yields:
+            CountryIndicator: each instance of the page
+        """
+        countries = [country] if country else []
+        url = cls._url(indicator, countries, kwargs)
+        summary, records = _request_stream(url, parameters=kwargs)
+        if not isinstance(indicator, Indicator):
+            # from_api builds the indicator from each record, see full_indicator
+            indicator = None
+        for item in records:
+            instance = cls.from_api(item, indicator=indicator)
+            if country:
+                instance.country = country
+            yield instance
+
+    @classmethod
+    def get_arrays(cls, indicator, country=None, **kwargs):
+        """
+        Fetches the same observations as get, stored column-wise in numpy arrays rather than as one object per observation
+
+        Arguments:
+            indicator (Indicator|str): indicator
+            country (Country|str,optional):  The country for which to fetch observations
+
+        Keyword Arguments:
+            page (int, optional):  The page number to get, defaults to 1.
+            per_page (int, optional):  The number of items to fetch in each page, defaults to 50.
+            start (int, optional):  The first year to fetch, used with end
+            end (int, optional):  The last year to fetch, used with start
+
+        Returns
+            tuple (dict, CountryIndicatorArrays): dictionary summary, and the observations
+        """
+        if np is None:
+            raise ImportError('numpy is required for CountryIndicator.get_arrays')
+        countries = [country] if country else []
+        url = cls._url(indicator, countries, kwargs)
+        summary, data = _request(url, parameters=kwargs)
+        data = data or []
+
+        years, values, decimals = cls._numeric_columns(data)
+        country_iso3codes = [item['countryiso3code'] for item in data]
+        return summary, CountryIndicatorArrays(indicator, country_iso3codes, years, values, decimals)
+
+    @classmethod
+    def get_frame(cls, indicator, country=None, **kwargs):
+        """
+        Fetches the same observations as get, as a pandas DataFrame with one row per observation, see from_api_frame
+
+        Arguments:
+            indicator (Indicator|str): indicator
+            country (Country|str,optional):  The country for which to fetch observations
+
+        Keyword Arguments:
+            page (int, optional):  The page number to get, defaults to 1.
+            per_page (int, optional):  The number of items to fetch in each page, defaults to 50.
+            start (int, optional):  The first year to fetch, used with end
+            end (int, optional):  The last year to fetch, used with start
+
+        Returns
+            tuple (dict, pandas.DataFrame): dictionary summary, and the observations
+        """
+        if pd is None:
+            raise ImportError('pandas is required for CountryIndicator.get_frame')
+        countries = [country] if country else []
+        url = cls._url(indicator, countries, kwargs)
+        summary, data = _request(url, parameters=kwargs)
+        return summary, cls.from_api_frame(data or [])
+
+    @staticmethod
+    def _numeric_columns(data):
+        """
+        Returns the years, values and decimals of API data as numpy arrays
+        """
+        # each column is converted by numpy in a single call; sub-annual dates look like 2019Q1 or 2019M01
+        years = np.array([item['date'][:4] for item in data], dtype=np.int16)
+        # numpy converts missing (None) values to NaN
+        values = np.array([item['value'] for item in data], dtype=np.float64)
+        decimals = np.array([item['decimal'] for item in data], dtype=np.int8)
+        return years, values, decimals
+
+    @classmethod
+    def from_api_frame(cls, data):
+        """
+        Returns a pandas DataFrame of API data with one row per observation, in place of a list of class instances.
+        The country and indicator codes, repeated on every row, are stored as categoricals.
+
+        Arguments:
+            data (list): API data
+        """
+        if pd is None:
+            raise ImportError('pandas is required for CountryIndicator.from_api_frame')
+        years, values, decimals = cls._numeric_columns(data)
+        return pd.DataFrame({
+            'indicator_id': pd.Categorical([item['indicator']['id'] for item in data]),
+            'country_id': pd.Categorical([item['country']['id'] for item in data]),
+            'country_name': pd.Categorical([item['country']['value'] for item in data]),
+            'country_iso3code': pd.Categorical([item['countryiso3code'] for item in data]),
+            'year': years,
+            'value': values,
+            'decimal': decimals,
+        })
+
+
+class CountryIndicatorArrays(object):
+    """
+    The observations of an indicator, stored column-wise with one array element per observation
+
+    Attributes:
+        indicator (Indicator|str):
+        country_iso3codes (list<str>):
+        years (numpy.ndarray<int16>):
+        values (numpy.ndarray<float64>):  NaN where the API has no value
+        decimals (numpy.ndarray<int8>):
+    """
+    __slots__ = ('indicator', 'country_iso3codes', 'years', 'values', 'decimals')
+
+    def __init__(self, indicator, country_iso3codes, years, values, decimals):
+        self.indicator = indicator
+        self.country_iso3codes = country_iso3codes
+        self.years = years
+        self.values = values
+        self.decimals = decimals
+
+    def __len__(self):
+        return len(self.years)
+
+    def __repr__(self):
+        return '<%s %s indicator=%s, size=%s>' % (self.__class__.__name__, id(self), self.indicator, len(self))
+
 
 class Topic(object):
     """
@@ -636,7 +1563,12 @@ class Topic(object):
 
     See https://datahelpdesk.worldbank.org/knowledgebase/articles/898611-api-topic-queries
     """
-    __slots__ = ('id', 'value', 'note')
+    __slots__ = ('id', 'value', 'note', '__weakref__')
+
+    _URL = domain + '/topics/'
+
+    # instances shared between the records that reference them, see _from_api_pooled
+    _pool = weakref.WeakValueDictionary()
 
     def __init__(self, id, value, note):
         self.id = id
@@ -656,10 +1588,22 @@ class Topic(object):
         """
         topic_id = data['id']
         value = data['value']
-        note = data.get('sourceNote', None)
+        note = data.get('sourceNote')
         return cls(topic_id, value, note)
 
     @classmethod
+    def _from_api_pooled(cls, data):
+        """
+        Returns a class instance from API data, shared with any other record that references the same data
+        """
+        key = (data['id'], data.get('value'))
+        instance = cls._pool.get(key)
+        if instance is None:
+            instance = cls._pool[key] = cls.from_api(data)
+        return instance
+
+    @classmethod
+    @memoize(ttl=3600)
     def get(cls, **kwargs):
         """
         Keyword Arguments:
@@ -669,21 +1613,38 @@ class Topic(object):
         Returns
             tuple (dict, list): dictionary summary, and a list of instances
         """
-        url = '%s/topics/' % domain
+        url = cls._URL
         summary, data = _request(url, parameters=kwargs)
         instances = [cls.from_api(item) for item in data]
         return summary, instances
 
+    @classmethod
+    async def aget(cls, **kwargs):
+        """
+        Like get, but awaits the API so it can run concurrently with other requests, ex. with asyncio.gather
+
+        Keyword Arguments:
+            page (int, optional):  The page number to get, defaults to 1.
+            per_page (int, optional):  The number of items to fetch in each page, defaults to 50.
+
+        Returns:
+            tuple (dict, list): dictionary summary, and a list of instances
+        """
+        url = cls._URL
+        summary, data = await _request_async(url, parameters=kwargs)
+        instances = [cls.from_api(item) for item in data]
+        return summary, instances
+
 
 if __name__ == '__main__':
-    summary, indicators = Indicator.get()
+    if httpx is not None:
+        async def main():
+            return await asyncio.gather(Indicator.aget(), Country.aget(), LendingType.aget(), Topic.aget(), Source.aget(), IncomeLevel.aget())
+        results = asyncio.run(main())
+    else:
+        results = fetch_many([Indicator.get, Country.get, LendingType.get, Topic.get, Source.get, IncomeLevel.get])
+    (summary, indicators), (summary, countries), (summary, lending_types), (summary, topics), (summary, sources), (summary, income_levels) = results
     summary, country_indicators = CountryIndicator.get(indicators[0])
-    summary, countries = Country.get()
-    summary, lending_types = LendingType.get()
-    summary, topics = Topic.get()
-    summary, sources = Source.get()
-    summary, income_levels = IncomeLevel.get()
-    summary, indicators = Indicator.get()
     summary, countries = Country.by_income_level(income_level=income_levels[0])
     summary, country = Country.by_lending_type(lending_types[0])
     summary, indicators = Indicator.by_source(sources[0])